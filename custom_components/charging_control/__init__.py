@@ -6,39 +6,69 @@ from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 
+from .controller import ChargerController, update_charger_from_calculations
+from .coordinator import ChargingControlCoordinator
+
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "charging_control"
 PLATFORMS = [Platform.SENSOR, Platform.SWITCH, Platform.SELECT]
 
+# Bookkeeping key in hass.data[DOMAIN], entry ids never start with "_"
+DEFAULT_ENTRY_ID = "_default_entry_id"
+
+
+def _entry_ids(hass: HomeAssistant) -> list[str]:
+    """Return the ids of the loaded config entries."""
+    return [key for key in hass.data[DOMAIN] if not key.startswith("_")]
+
+
+@callback
+def _async_remove_services(hass: HomeAssistant) -> None:
+    """Remove the domain services once no entries are loaded."""
+    if not _entry_ids(hass):
+        hass.services.async_remove(DOMAIN, "update_charger")
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Charging Control from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    coordinator = ChargingControlCoordinator(hass, entry)
+    await coordinator.async_config_entry_first_refresh()
+    entry.async_on_unload(coordinator.async_track_sources())
+
+    domain_data = hass.data.get(DOMAIN)
+    if domain_data is None:
+        domain_data = hass.data[DOMAIN] = {}
+    domain_data[entry.entry_id] = {
+        "data": entry.data,
+        "coordinator": coordinator,
+        "controller": ChargerController(hass, entry.data),
+    }
+    if DEFAULT_ENTRY_ID not in domain_data:
+        domain_data[DEFAULT_ENTRY_ID] = entry.entry_id
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Register services
+    # Runs after a successful unload, when this entry is gone from hass.data
+    entry.async_on_unload(lambda: _async_remove_services(hass))
+
+    # Register services once, they are shared by all entries
+    if hass.services.has_service(DOMAIN, "update_charger"):
+        return True
+
     async def handle_update_charger(call):
         """Handle the update_charger service call."""
-        from .sensor import update_charger_from_calculations
-        
-        entry_id = call.data.get("entry_id")
+        # Fall back to the default entry if no specific entry_id provided
+        entry_id = call.data.get("entry_id") or hass.data[DOMAIN].get(DEFAULT_ENTRY_ID)
         if not entry_id:
-            # Find the first entry if no specific entry_id provided
-            entries = hass.config_entries.async_entries(DOMAIN)
-            if entries:
-                entry_id = entries[0].entry_id
-            else:
-                _LOGGER.error("No charging control entries found")
-                return
+            _LOGGER.error("No charging control entries found")
+            return
         
-        if entry_id not in hass.data[DOMAIN]:
-            _LOGGER.error(f"Entry {entry_id} not found")
+        if entry_id.startswith("_") or entry_id not in hass.data[DOMAIN]:
+            _LOGGER.error("Entry %s not found", entry_id)
             return
             
         await update_charger_from_calculations(hass, entry_id)
@@ -56,15 +86,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
-        
-        # Remove services if this was the last entry
-        if not hass.data[DOMAIN]:
-            hass.services.async_remove(DOMAIN, "update_charger")
+        remaining = _entry_ids(hass)
+
+        # Hand the default over to another loaded entry
+        if hass.data[DOMAIN].get(DEFAULT_ENTRY_ID) == entry.entry_id:
+            if remaining:
+                hass.data[DOMAIN][DEFAULT_ENTRY_ID] = remaining[0]
+            else:
+                hass.data[DOMAIN].pop(DEFAULT_ENTRY_ID)
 
     return unload_ok
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
\ No newline at end of file
+    await hass.config_entries.async_reload(entry.entry_id)
\ No newline at end of file
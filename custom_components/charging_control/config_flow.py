@@ -15,6 +15,41 @@ _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "charging_control"
 
+# Selectors and schema are built once at import and shared by both flows
+_SENSOR_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="sensor")
+)
+_SWITCH_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="switch")
+)
+_SELECT_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain=["input_select", "select"])
+)
+_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=5, max=60, step=1, mode=selector.NumberSelectorMode.BOX
+    )
+)
+
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required("max_import_power_entity"): _SENSOR_SELECTOR,
+        vol.Required("avg_import_power_15min_entity"): _SENSOR_SELECTOR,
+        vol.Required("current_l1_entity"): _SENSOR_SELECTOR,
+        vol.Optional("current_l2_entity"): _SENSOR_SELECTOR,
+        vol.Optional("current_l3_entity"): _SENSOR_SELECTOR,
+        vol.Required("voltage_l1_entity"): _SENSOR_SELECTOR,
+        vol.Optional("voltage_l2_entity"): _SENSOR_SELECTOR,
+        vol.Optional("voltage_l3_entity"): _SENSOR_SELECTOR,
+        vol.Optional("charger_current_l1_entity"): _SENSOR_SELECTOR,
+        vol.Optional("charger_current_l2_entity"): _SENSOR_SELECTOR,
+        vol.Optional("charger_current_l3_entity"): _SENSOR_SELECTOR,
+        vol.Optional("update_interval", default=10): _INTERVAL_SELECTOR,
+        vol.Optional("charger_switch_entity"): _SWITCH_SELECTOR,
+        vol.Optional("charger_current_select_entity"): _SELECT_SELECTOR,
+    }
+)
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Charging Control."""
@@ -54,58 +89,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 )
 
         # Show the configuration form
-        data_schema = vol.Schema(
-            {
-                vol.Required("max_import_power_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Required("avg_import_power_15min_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Required("current_l1_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional("current_l2_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional("current_l3_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Required("voltage_l1_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional("voltage_l2_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional("voltage_l3_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional("charger_current_l1_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional("charger_current_l2_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional("charger_current_l3_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional("update_interval", default=10): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=5, max=60, step=1, mode=selector.NumberSelectorMode.BOX
-                    )
-                ),
-                vol.Optional("charger_switch_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="switch")
-                ),
-                vol.Optional("charger_current_select_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=["input_select", "select"])
-                ),
-            }
-        )
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -132,101 +118,10 @@ class OptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        # Get current values
-        current_data = self.config_entry.data
-
-        data_schema = vol.Schema(
-            {
-                vol.Required(
-                    "max_import_power_entity",
-                    default=current_data.get("max_import_power_entity"),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Required(
-                    "avg_import_power_15min_entity",
-                    default=current_data.get("avg_import_power_15min_entity"),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Required(
-                    "current_l1_entity",
-                    default=current_data.get("current_l1_entity"),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(
-                    "current_l2_entity",
-                    default=current_data.get("current_l2_entity"),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(
-                    "current_l3_entity",
-                    default=current_data.get("current_l3_entity"),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Required(
-                    "voltage_l1_entity",
-                    default=current_data.get("voltage_l1_entity"),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(
-                    "voltage_l2_entity",
-                    default=current_data.get("voltage_l2_entity"),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(
-                    "voltage_l3_entity",
-                    default=current_data.get("voltage_l3_entity"),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(
-                    "charger_current_l1_entity",
-                    default=current_data.get("charger_current_l1_entity"),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(
-                    "charger_current_l2_entity",
-                    default=current_data.get("charger_current_l2_entity"),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(
-                    "charger_current_l3_entity",
-                    default=current_data.get("charger_current_l3_entity"),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(
-                    "update_interval",
-                    default=current_data.get("update_interval", 10),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=5, max=60, step=1, mode=selector.NumberSelectorMode.BOX
-                    )
-                ),
-                vol.Optional(
-                    "charger_switch_entity",
-                    default=current_data.get("charger_switch_entity"),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="switch")
-                ),
-                vol.Optional(
-                    "charger_current_select_entity",
-                    default=current_data.get("charger_current_select_entity"),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=["input_select", "select"])
-                ),
-            }
-        )
-
+        # Pre-fill the shared schema with the current values
         return self.async_show_form(
             step_id="init",
-            data_schema=data_schema,
-        )
\ No newline at end of file
+            data_schema=self.add_suggested_values_to_form(
+                _USER_SCHEMA, self.config_entry.data
+            ),
+        )
@@ -0,0 +1,173 @@
+"""Charger control for Charging Control."""
+from __future__ import annotations
+
+import logging
+from bisect import bisect_right
+from collections.abc import Mapping
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "charging_control"
+
+
+class ChargerController:
+    """Drive the charger switch and current select entities of an entry."""
+    
+    def __init__(self, hass: HomeAssistant, config: Mapping[str, Any]) -> None:
+        """Initialize the charger controller."""
+        self.hass = hass
+        
+        # Charger control entities (optional)
+        self.charger_switch_entity = config.get("charger_switch_entity")
+        self.charger_current_select_entity = config.get("charger_current_select_entity")
+        self._current_select_domain = (
+            "input_select"
+            if self.charger_current_select_entity
+            and self.charger_current_select_entity.startswith("input_select.")
+            else "select"
+        )
+        
+        # Last requested (charging enabled, charging allowed, max current)
+        self._last_request: tuple[bool, bool, int] | None = None
+        
+        # Last charger current command as (target current, offered options,
+        # selected option)
+        self._last_cmd_current: tuple[int, tuple[str, ...], str] | None = None
+        
+        # Numeric charger current options, parsed once per option list
+        self._parsed_options_key: tuple[str, ...] | None = None
+        self._option_currents: list[int] = []
+        self._option_names: list[str] = []
+    
+    @property
+    def configured(self) -> bool:
+        """Return true if any charger control entity is configured."""
+        return bool(self.charger_switch_entity or self.charger_current_select_entity)
+    
+    async def async_update(
+        self, charging_enabled: bool, charging_allowed: bool, max_current: int
+    ) -> None:
+        """Update charger control entities based on calculations."""
+        self._last_request = (charging_enabled, charging_allowed, max_current)
+        try:
+            # Control charger switch if configured
+            if self.charger_switch_entity:
+                await self._control_charger_switch(charging_enabled and charging_allowed)
+            
+            # Control charger current if configured
+            if self.charger_current_select_entity and charging_enabled and charging_allowed:
+                await self._control_charger_current(max_current)
+                
+        except Exception as e:
+            _LOGGER.error(f"Error updating charger control: {e}")
+    
+    async def async_reapply(self) -> None:
+        """Apply the last calculated values to the charger again."""
+        if not self.configured:
+            _LOGGER.debug("No charger entities configured")
+            return
+        if self._last_request is None:
+            _LOGGER.warning("No charging calculations available yet")
+            return
+        await self.async_update(*self._last_request)
+    
+    async def _control_charger_switch(self, should_charge: bool) -> None:
+        """Control the charger switch entity."""
+        try:
+            current_state = self.hass.states.get(self.charger_switch_entity)
+            if current_state is None:
+                _LOGGER.warning(f"Charger switch entity {self.charger_switch_entity} not found")
+                return
+            
+            current_is_on = current_state.state == "on"
+            
+            if should_charge and not current_is_on:
+                await self.hass.services.async_call(
+                    "switch", "turn_on", {"entity_id": self.charger_switch_entity}
+                )
+                _LOGGER.debug(f"Turned on charger switch: {self.charger_switch_entity}")
+            elif not should_charge and current_is_on:
+                await self.hass.services.async_call(
+                    "switch", "turn_off", {"entity_id": self.charger_switch_entity}
+                )
+                _LOGGER.debug(f"Turned off charger switch: {self.charger_switch_entity}")
+                
+        except Exception as e:
+            _LOGGER.error(f"Error controlling charger switch: {e}")
+    
+    async def _control_charger_current(self, target_current: int) -> None:
+        """Control the charger current select entity."""
+        try:
+            current_state = self.hass.states.get(self.charger_current_select_entity)
+            if current_state is None:
+                _LOGGER.warning(f"Charger current select entity {self.charger_current_select_entity} not found")
+                return
+            
+            # Get available options
+            options = current_state.attributes.get("options", [])
+            if not options:
+                _LOGGER.warning(f"No options available for {self.charger_current_select_entity}")
+                return
+            
+            # Skip option matching if the select still shows what we last
+            # commanded for the same target and the same options
+            options_key = tuple(options)
+            if self._last_cmd_current == (target_current, options_key, current_state.state):
+                return
+            
+            # Find the best matching option
+            target_str = str(target_current)
+            if target_str in options:
+                selected_option = target_str
+            else:
+                self._parse_current_options(options_key)
+                
+                # Select the highest available current that's <= target
+                index = bisect_right(self._option_currents, target_current) - 1
+                if index < 0:
+                    # If no suitable option found, don't change anything
+                    return
+                selected_option = self._option_names[index]
+            
+            # Only update if different from current selection
+            if current_state.state != selected_option:
+                await self.hass.services.async_call(
+                    self._current_select_domain, "select_option", 
+                    {"entity_id": self.charger_current_select_entity, "option": selected_option}
+                )
+                _LOGGER.debug(f"Set charger current to {selected_option}A: {self.charger_current_select_entity}")
+            self._last_cmd_current = (target_current, options_key, selected_option)
+                
+        except Exception as e:
+            _LOGGER.error(f"Error controlling charger current: {e}")
+    
+    def _parse_current_options(self, options: tuple[str, ...]) -> None:
+        """Parse and sort the numeric options if the option list changed."""
+        if options == self._parsed_options_key:
+            return
+        
+        parsed = []
+        for option in options:
+            try:
+                parsed.append((int(option), option))
+            except ValueError:
+                continue
+        parsed.sort()
+        
+        self._parsed_options_key = options
+        self._option_currents = [current for current, _ in parsed]
+        self._option_names = [option for _, option in parsed]
+
+
+async def update_charger_from_calculations(hass: HomeAssistant, entry_id: str) -> None:
+    """Service function to manually update charger based on current calculations."""
+    # Get the charger controller of the entry
+    if entry_id not in hass.data.get(DOMAIN, {}):
+        _LOGGER.error(f"Entry {entry_id} not found in domain data")
+        return
+    
+    # Update charger control
+    await hass.data[DOMAIN][entry_id]["controller"].async_reapply()
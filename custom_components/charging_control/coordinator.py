@@ -0,0 +1,97 @@
+"""Data update coordinator for Charging Control."""
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "charging_control"
+
+# Config keys of the numeric source entities read on every update
+SOURCE_ENTITY_KEYS = (
+    "max_import_power_entity",
+    "avg_import_power_15min_entity",
+    "current_l1_entity",
+    "current_l2_entity",
+    "current_l3_entity",
+    "voltage_l1_entity",
+    "voltage_l2_entity",
+    "voltage_l3_entity",
+    "charger_current_l1_entity",
+    "charger_current_l2_entity",
+    "charger_current_l3_entity",
+)
+
+
+class ChargingControlCoordinator(DataUpdateCoordinator[dict[str, float]]):
+    """Read the source entities once per update for all entities of an entry."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the coordinator."""
+        update_interval = entry.data.get("update_interval", 10)
+        # Refresh on the first source change, then coalesce the rest of a
+        # burst into at most one more refresh per interval
+        self._refresh_debouncer = Debouncer(
+            hass, _LOGGER, cooldown=update_interval, immediate=True
+        )
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            config_entry=entry,
+            update_interval=timedelta(seconds=update_interval),
+            request_refresh_debouncer=self._refresh_debouncer,
+        )
+        self.source_entities = tuple(
+            entity_id
+            for key in SOURCE_ENTITY_KEYS
+            if (entity_id := entry.data.get(key))
+        )
+        # Last parsed value per source entity, keyed on its state string
+        self._value_cache: dict[str, tuple[str, float]] = {}
+
+    async def _async_update_data(self) -> dict[str, float]:
+        """Read the numeric state of the source entities."""
+        data: dict[str, float] = {}
+        for entity_id in self.source_entities:
+            state = self.hass.states.get(entity_id)
+            if state is None or state.state in ("unknown", "unavailable"):
+                continue
+            cached = self._value_cache.get(entity_id)
+            if cached is not None and cached[0] == state.state:
+                data[entity_id] = cached[1]
+                continue
+            try:
+                data[entity_id] = value = float(state.state)
+                self._value_cache[entity_id] = (state.state, value)
+            except (ValueError, TypeError):
+                _LOGGER.warning(
+                    "Could not convert state of %s to float: %s", entity_id, state.state
+                )
+        return data
+
+    @callback
+    def async_track_sources(self) -> CALLBACK_TYPE:
+        """Request a refresh whenever a source entity changes state."""
+        return async_track_state_change_event(
+            self.hass, self.source_entities, self._handle_source_change
+        )
+
+    @callback
+    def _handle_source_change(self, event: Event) -> None:
+        """Handle state changes of the source entities."""
+        # Attribute-only changes leave the value we read untouched
+        new_state = event.data.get("new_state")
+        old_state = event.data.get("old_state")
+        if new_state is None or (
+            old_state is not None and old_state.state == new_state.state
+        ):
+            return
+        self._refresh_debouncer.async_schedule_call()
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from collections.abc import Mapping
+from typing import Any, Final
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
@@ -14,6 +15,11 @@ _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "charging_control"
 
+# Options from 6A to 32A, one list shared by all select entities as
+# SelectEntity declares _attr_options as list[str]
+_CURRENT_OPTIONS: Final[list[str]] = [str(i) for i in range(6, 33)]
+_CURRENT_OPTIONS_SET: Final[frozenset[str]] = frozenset(_CURRENT_OPTIONS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,64 +41,54 @@ class MaxChargingCurrentSelect(SelectEntity, RestoreEntity):
     
     _attr_icon = "mdi:speedometer"
     _attr_has_entity_name = True
+    _attr_options = _CURRENT_OPTIONS
+    _attr_current_option = "16"  # Default to 16A
     
-    def __init__(self, hass: HomeAssistant, config: dict[str, Any], entry_id: str) -> None:
+    def __init__(self, hass: HomeAssistant, config: Mapping[str, Any], entry_id: str) -> None:
         """Initialize the select entity."""
         self.hass = hass
         self.config = config
         self._entry_id = entry_id
+        self._attr_name = "Max Charging Current"
         self._attr_unique_id = f"{DOMAIN}_max_charging_current_cap_{self._entry_id}"
-        
-        # Generate options from 6A to 32A
-        self._attr_options = [str(i) for i in range(6, 33)]
-        self._attr_current_option = "16"  # Default to 16A
-    
-    @property
-    def name(self) -> str:
-        """Return the name of the select entity."""
-        return "Max Charging Current"
-    
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
+        self._attr_device_info = {
             "identifiers": {(DOMAIN, self._entry_id)},
             "name": "Charging Control",
             "manufacturer": "Custom",
             "model": "Charging Control Integration",
         }
+        self._attr_extra_state_attributes = self._build_attributes()
     
     async def async_added_to_hass(self) -> None:
         """Handle entity being added to hass."""
         await super().async_added_to_hass()
         
-        # Restore previous state
-        if last_state := await self.async_get_last_state():
-            if last_state.state in self._attr_options:
-                self._attr_current_option = last_state.state
-            else:
-                # If restored state is invalid, use default
-                self._attr_current_option = "16"
+        # Restore previous state, an invalid or default state keeps the default
+        if (
+            (last_state := await self.async_get_last_state())
+            and last_state.state in _CURRENT_OPTIONS_SET
+            and last_state.state != self._attr_current_option
+        ):
+            self._set_current_option(last_state.state)
     
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        if option in self._attr_options:
-            self._attr_current_option = option
+        if option in _CURRENT_OPTIONS_SET:
+            self._set_current_option(option)
             self.async_write_ha_state()
-            _LOGGER.debug(f"Max charging current cap set to {option}A")
+            _LOGGER.debug("Max charging current cap set to %sA", option)
         else:
-            _LOGGER.warning(f"Invalid charging current option: {option}")
+            _LOGGER.warning("Invalid charging current option: %s", option)
     
-    @property
-    def current_option(self) -> str:
-        """Return the current selected option."""
-        return self._attr_current_option
+    def _set_current_option(self, option: str) -> None:
+        """Set the current option and refresh the cached attributes."""
+        self._attr_current_option = option
+        self._attr_extra_state_attributes = self._build_attributes()
     
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build extra state attributes for the current option."""
         return {
             "unit_of_measurement": "A",
             "description": f"Maximum allowed charging current cap. Current setting: {self._attr_current_option}A",
             "range": "6A - 32A",
-        }
\ No newline at end of file
+        }
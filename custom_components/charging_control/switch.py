@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
@@ -36,7 +37,7 @@ class ChargingEnabledSwitch(SwitchEntity, RestoreEntity):
     _attr_icon = "mdi:power"
     _attr_has_entity_name = True
     
-    def __init__(self, hass: HomeAssistant, config: dict[str, Any], entry_id: str) -> None:
+    def __init__(self, hass: HomeAssistant, config: Mapping[str, Any], entry_id: str) -> None:
         """Initialize the switch."""
         self.hass = hass
         self.config = config